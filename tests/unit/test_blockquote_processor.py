@@ -103,6 +103,8 @@ def test_blockquote_processor_remove_quote_marks_method():
     assert processor._remove_quote_marks("'Quote'") == "Quote"
     assert processor._remove_quote_marks("No quotes") == "No quotes"
     assert processor._remove_quote_marks("") == ""
+    # Only one mark is removed from each edge
+    assert processor._remove_quote_marks("''Quote''") == "'Quote'"
 
 
 def test_blockquote_processor_max_nesting():
@@ -120,3 +122,12 @@ def test_blockquote_processor_max_nesting():
 
     assert isinstance(result, BlockquoteElement)
     assert result.level <= 5
+
+
+def test_blockquote_processor_custom_quote_chars():
+    """Test quote_chars set on an instance is used for stripping."""
+    processor = BlockquoteProcessor()
+    processor.quote_chars = frozenset({"„", "“"})
+
+    assert processor._remove_quote_marks("„Quote“") == "Quote"
+    assert processor._remove_quote_marks('"Quote"') == '"Quote"'
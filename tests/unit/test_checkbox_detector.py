@@ -0,0 +1,160 @@
+"""Unit tests for unpdf.processors.checkboxes module."""
+
+from typing import NamedTuple
+
+from unpdf.processors.checkboxes import CheckboxDetector, CheckboxDrawing
+
+
+class Rect(NamedTuple):
+    """Minimal stand-in for a PyMuPDF Rect."""
+
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+
+def _drawing(x0: float, y0: float, size: float = 12.0, fill=None) -> dict:
+    """Build a drawing dict shaped like PyMuPDF's get_drawings() output."""
+    return {"rect": Rect(x0, y0, x0 + size, y0 + size), "fill": fill}
+
+
+def test_group_drawings_by_position_merges_nearby_shapes():
+    """Test overlapping drawings are grouped, distant ones are not."""
+    detector = CheckboxDetector()
+    drawings = [
+        _drawing(60, 100),
+        _drawing(300, 100),
+        _drawing(61, 101),
+        _drawing(60, 200),
+    ]
+
+    groups = detector._group_drawings_by_position(drawings, tolerance=5.0)
+
+    assert [len(group) for group in groups] == [2, 1, 1]
+    assert groups[0] == [drawings[0], drawings[2]]
+
+
+def test_group_drawings_by_position_prefers_earliest_group():
+    """Test a drawing near two groups joins the one created first."""
+    detector = CheckboxDetector()
+    drawings = [
+        _drawing(108, 100),
+        _drawing(100, 100),
+        _drawing(104, 100),
+    ]
+
+    groups = detector._group_drawings_by_position(drawings, tolerance=5.0)
+
+    assert groups == [[drawings[0], drawings[2]], [drawings[1]]]
+
+
+def test_group_drawings_by_position_isolates_non_finite_rects():
+    """Test drawings with NaN or infinite coordinates get their own group."""
+    detector = CheckboxDetector()
+    nan, inf = float("nan"), float("inf")
+    drawings = [
+        {"rect": Rect(nan, 0, nan, 1)},
+        _drawing(60, 100),
+        {"rect": Rect(inf, 0, inf, 1)},
+        _drawing(61, 101),
+    ]
+
+    groups = detector._group_drawings_by_position(drawings, tolerance=5.0)
+
+    assert groups == [[drawings[0]], [drawings[1], drawings[3]], [drawings[2]]]
+
+
+def test_is_checkbox_group_checks_size_and_shape():
+    """Test checkbox shape validation."""
+    detector = CheckboxDetector()
+
+    assert detector._is_checkbox_group([_drawing(60, 100)], 8.0, 20.0)
+    assert not detector._is_checkbox_group([_drawing(60, 100, size=40)], 8.0, 20.0)
+    assert not detector._is_checkbox_group([], 8.0, 20.0)
+
+
+def test_is_checked_by_fill_color():
+    """Test checked state detection from known fill colors."""
+    detector = CheckboxDetector()
+
+    checked = [_drawing(60, 100, fill=(0.6, 0.45, 0.97))]
+    unchecked = [_drawing(60, 100, fill=(1.0, 1.0, 1.0))]
+
+    assert detector._is_checked(checked)
+    assert not detector._is_checked(unchecked)
+
+
+def test_annotate_text_with_checkboxes_adds_markers():
+    """Test spans next to checkboxes get Markdown task markers."""
+    detector = CheckboxDetector()
+    spans = [
+        {"text": "Done", "x0": 80, "y0": 690, "y1": 702, "font_family": "Arial"},
+        {"text": "Todo", "x0": 80, "y0": 660, "y1": 672, "font_family": "Arial"},
+        {"text": "Plain", "x0": 80, "y0": 400, "y1": 412, "font_family": "Arial"},
+    ]
+    checkboxes = [
+        CheckboxDrawing(x=66, y=104, is_checked=True),
+        CheckboxDrawing(x=66, y=134, is_checked=False),
+    ]
+
+    annotated = detector.annotate_text_with_checkboxes(
+        spans, checkboxes, page_height=800
+    )
+
+    assert [s["text"] for s in annotated] == ["[x] Done", "[ ] Todo", "Plain"]
+    assert annotated[0]["checkbox_checked"] is True
+    assert "has_checkbox" not in annotated[2]
+    # Original spans are left untouched; unmatched ones are not copied
+    assert spans[0]["text"] == "Done"
+    assert annotated[2] is spans[2]
+
+
+def test_annotate_text_with_checkboxes_ignores_off_margin_checkboxes():
+    """Test checkboxes away from the left margin never annotate spans."""
+    detector = CheckboxDetector()
+    spans = [{"text": "Mid", "x0": 300, "y0": 690, "y1": 702}]
+    checkboxes = [CheckboxDrawing(x=290, y=104, is_checked=True)]
+
+    annotated = detector.annotate_text_with_checkboxes(
+        spans, checkboxes, page_height=800
+    )
+
+    assert annotated == spans
+    assert annotated is not spans
+
+
+def test_annotate_text_with_checkboxes_skips_monospace():
+    """Test monospace spans are not treated as task items."""
+    detector = CheckboxDetector()
+    spans = [
+        {"text": "- [ ] x", "x0": 80, "y0": 690, "y1": 702, "font_family": "Courier"}
+    ]
+    checkboxes = [CheckboxDrawing(x=66, y=104, is_checked=False)]
+
+    annotated = detector.annotate_text_with_checkboxes(
+        spans, checkboxes, page_height=800
+    )
+
+    assert annotated[0]["text"] == "- [ ] x"
+
+
+def test_is_monospace_font_respects_subclass_fonts():
+    """Test an overridden MONOSPACE_FONTS list is used for detection."""
+
+    class CustomDetector(CheckboxDetector):
+        MONOSPACE_FONTS = ("iosevka",)
+
+    assert CustomDetector()._is_monospace_font("Iosevka-Term")
+    assert not CustomDetector()._is_monospace_font("Courier")
+    assert CheckboxDetector()._is_monospace_font("Courier")
+
+
+def test_is_monospace_font_memo_is_bounded():
+    """Test subset-prefixed font names do not grow the memo without bound."""
+    detector = CheckboxDetector()
+
+    for index in range(1000):
+        detector._is_monospace_font(f"SUB{index:03d}+Helvetica")
+
+    assert detector._monospace_lookup.cache_info().currsize <= 128
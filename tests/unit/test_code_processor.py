@@ -1,5 +1,7 @@
 """Unit tests for unpdf.processors.code module."""
 
+from unittest.mock import Mock
+
 from unpdf.processors.code import (
     CodeBlockElement,
     CodeProcessor,
@@ -191,6 +193,18 @@ def test_code_processor_is_monospace_font():
     assert processor._is_monospace_font("") is False
 
 
+def test_code_processor_is_monospace_font_searches_each_name_once():
+    """Test repeated font names do not re-run the monospace regex."""
+    processor = CodeProcessor()
+    processor.monospace_regex = Mock(wraps=processor.monospace_regex)
+
+    for _ in range(3):
+        assert processor._is_monospace_font("Courier") is True
+        assert processor._is_monospace_font("Arial") is False
+
+    assert processor.monospace_regex.search.call_count == 2
+
+
 def test_code_processor_infer_language():
     """Test language inference method."""
     processor = CodeProcessor()
@@ -27,12 +27,19 @@ def test_paragraph_element_to_markdown():
     assert para.to_markdown() == "Plain text"
 
 
+def test_elements_use_slots():
+    """Test element dataclasses are slotted (no per-instance __dict__)."""
+    assert not hasattr(HeadingElement("Title"), "__dict__")
+    assert not hasattr(ParagraphElement("Plain text"), "__dict__")
+
+
 def test_heading_processor_initialization():
     """Test HeadingProcessor initialization."""
     processor = HeadingProcessor(avg_font_size=12.0)
     assert processor.avg_font_size == 12.0
     assert processor.heading_ratio == 1.3  # Default
     assert abs(processor.threshold - 15.6) < 0.01  # 12 * 1.3 (with float tolerance)
+    assert abs(processor.bold_threshold - 10.8) < 0.01  # 12 * 0.9
 
 
 def test_heading_processor_invalid_params():
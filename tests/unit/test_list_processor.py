@@ -1,5 +1,7 @@
 """Unit tests for unpdf.processors.lists module."""
 
+import re
+
 from unpdf.processors.headings import ParagraphElement
 from unpdf.processors.lists import ListItemElement, ListProcessor
 
@@ -146,3 +148,41 @@ def test_list_processor_is_bullet_list():
     assert processor._is_bullet_list("- Item") is True
     assert processor._is_bullet_list("Plain text") is False
     assert processor._is_bullet_list("") is False
+
+
+def test_list_processor_marker_pattern_kinds():
+    """Test combined marker pattern reports which marker matched."""
+    processor = ListProcessor()
+
+    def kind(text: str) -> str | None:
+        match = processor.marker_pattern.match(text)
+        return match.lastgroup if match else None
+
+    assert kind("[x] Done") == "checkbox"
+    assert kind("(cid:127) Item") == "cid"
+    assert kind("12. Item") == "number"
+    assert kind("IV. Item") == "number"
+    assert kind("Plain text") is None
+
+
+def test_list_processor_literal_checkbox_without_annotation():
+    """Test literal "[ ]" text is not a list item unless annotated."""
+    processor = ListProcessor()
+
+    result = processor.process({"text": "[ ] not a task", "x0": 200})
+    assert isinstance(result, ParagraphElement)
+
+
+def test_list_processor_pattern_overrides_take_effect():
+    """Test replacing a marker pattern updates list detection."""
+    processor = ListProcessor()
+    processor.number_pattern = re.compile(r"^(\d+\))\s+")
+
+    result = processor.process({"text": "1) item", "x0": 72})
+
+    assert isinstance(result, ListItemElement)
+    assert result.is_ordered
+    assert result.text == "item"
+    assert isinstance(
+        processor.process({"text": "1. item", "x0": 72}), ParagraphElement
+    )
@@ -16,12 +16,12 @@ Example:
 """
 
 import logging
+from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from unpdf.processors.code import CodeBlockElement, InlineCodeElement
-    from unpdf.processors.headings import ParagraphElement
     from unpdf.processors.table import TableElement
 
 logger = logging.getLogger(__name__)
@@ -36,12 +36,19 @@ def _group_code_blocks(elements: list[Any]) -> list[Any]:
     Returns:
         List with consecutive inline code elements merged into CodeBlockElement instances.
     """
-    from unpdf.processors.code import CodeBlockElement, InlineCodeElement
+    from unpdf.processors.code import (
+        CodeBlockElement,
+        CodeProcessor,
+        InlineCodeElement,
+    )
     from unpdf.processors.headings import ParagraphElement
 
     if not elements:
         return elements
 
+    # One processor for language inference across all flushed blocks
+    code_processor = CodeProcessor()
+
     grouped: list[CodeBlockElement | InlineCodeElement | ParagraphElement] = []
     code_buffer: list[InlineCodeElement] = []
     prev_y0: float | None = None
@@ -50,8 +57,8 @@ def _group_code_blocks(elements: list[Any]) -> list[Any]:
     for elem in elements:
         if isinstance(elem, InlineCodeElement):
             # Check if this code element is consecutive (same page, close y-position)
-            current_y0 = getattr(elem, "y0", 0)
-            current_page = getattr(elem, "page_number", 1)
+            current_y0 = elem.y0
+            current_page = elem.page_number
 
             if code_buffer and prev_y0 is not None and (
                 prev_page != current_page or abs(current_y0 - prev_y0) > 40
@@ -60,9 +67,7 @@ def _group_code_blocks(elements: list[Any]) -> list[Any]:
                 if len(code_buffer) >= 3:  # At least 3 lines for a code block
                     text = "\n".join(c.text for c in code_buffer)
                     # Try to infer language from first few lines
-                    from unpdf.processors.code import CodeProcessor
-
-                    lang = CodeProcessor()._infer_language(text)
+                    lang = code_processor._infer_language(text)
                     grouped.append(
                         CodeBlockElement(
                             text=text,
@@ -84,9 +89,7 @@ def _group_code_blocks(elements: list[Any]) -> list[Any]:
             if code_buffer:
                 if len(code_buffer) >= 3:
                     text = "\n".join(c.text for c in code_buffer)
-                    from unpdf.processors.code import CodeProcessor
-
-                    lang = CodeProcessor()._infer_language(text)
+                    lang = code_processor._infer_language(text)
                     grouped.append(
                         CodeBlockElement(
                             text=text,
@@ -107,9 +110,7 @@ def _group_code_blocks(elements: list[Any]) -> list[Any]:
     if code_buffer:
         if len(code_buffer) >= 3:
             text = "\n".join(c.text for c in code_buffer)
-            from unpdf.processors.code import CodeProcessor
-
-            lang = CodeProcessor()._infer_language(text)
+            lang = code_processor._infer_language(text)
             grouped.append(
                 CodeBlockElement(
                     text=text,
@@ -202,11 +203,20 @@ def convert_pdf(
     spans = extract_text_with_metadata(pdf_path, page_numbers=page_numbers)
 
     # Extract and annotate links
+    # Bucket spans by page once so each annotation only scans its own page
+    spans_by_page: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    for span in spans:
+        spans_by_page[span["page_number"]].append(span)
+
     try:
         import pdfplumber
 
         with pdfplumber.open(pdf_path) as pdf:
             for page_num, page in enumerate(pdf.pages, start=1):
+                page_spans = spans_by_page.get(page_num)
+                if not page_spans:
+                    continue
+
                 if hasattr(page, "annots") and page.annots:
                     for annot in page.annots:
                         url = annot.get("uri")
@@ -220,10 +230,7 @@ def convert_pdf(
                         y1 = annot.get("y1", 0)
 
                         # Find overlapping text spans
-                        for span in spans:
-                            if span["page_number"] != page_num:
-                                continue
-
+                        for span in page_spans:
                             # Check if span overlaps with link annotation
                             span_x0 = span["x0"]
                             span_y0 = span["y0"]
@@ -308,7 +315,7 @@ def convert_pdf(
     else:
         # Phase 3: Process spans into structured elements
         from unpdf.extractors.text import calculate_average_font_size
-        from unpdf.processors.headings import HeadingProcessor
+        from unpdf.processors.headings import HeadingProcessor, ParagraphElement
         from unpdf.processors.lists import ListProcessor
 
         avg_font_size = calculate_average_font_size(spans) if spans else 12.0
@@ -336,24 +343,24 @@ def convert_pdf(
             # 5. Paragraphs (default)
 
             code_result = code_processor.process(span)
-            if code_result.__class__.__name__ != "ParagraphElement":
+            if not isinstance(code_result, ParagraphElement):
                 elements.append(code_result)
                 continue
 
             heading_result = heading_processor.process(span)
-            if heading_result.__class__.__name__ != "ParagraphElement":
+            if not isinstance(heading_result, ParagraphElement):
                 elements.append(heading_result)  # type: ignore[arg-type]
                 # Update list processor context when we hit a heading
                 list_processor.update_context(span["text"])
                 continue
 
             list_result = list_processor.process(span)
-            if list_result.__class__.__name__ != "ParagraphElement":
+            if not isinstance(list_result, ParagraphElement):
                 elements.append(list_result)  # type: ignore[arg-type]
                 continue
 
             quote_result = blockquote_processor.process(span)
-            if quote_result.__class__.__name__ != "ParagraphElement":
+            if not isinstance(quote_result, ParagraphElement):
                 elements.append(quote_result)  # type: ignore[arg-type]
                 continue
 
@@ -381,34 +388,32 @@ def convert_pdf(
         if table_elements or hr_elements:
             # Filter out text elements that overlap with table bounding boxes
             # (to avoid duplicate content - pdfplumber extracts table cells as both text and tables)
-            def overlaps_table(elem: Any, tables: list[Any]) -> bool:
+            # Index table vertical ranges by page so each element only checks
+            # the tables on its own page. Table bbox is (x0, y0, x1, y1); a
+            # small margin (5 points) is added to avoid edge cases.
+            table_ranges: defaultdict[int, list[tuple[float, float]]] = defaultdict(
+                list
+            )
+            for table in table_elements:
+                table_ranges[table.page_number].append(
+                    (table.bbox[1] - 5, table.bbox[3] + 5)
+                )
+
+            def overlaps_table(elem: Any) -> bool:
                 """Check if element overlaps with any table bounding box."""
                 if not hasattr(elem, "y0") or not hasattr(elem, "page_number"):
                     return False
 
-                elem_page = elem.page_number
                 elem_y0 = elem.y0
 
-                # Check against all tables on same page
-                for table in tables:
-                    if table.page_number != elem_page:
-                        continue
-
-                    # Table bbox is (x0, y0, x1, y1)
-                    # Check if element's y0 falls within table's vertical range
-                    table_y0 = table.bbox[1]  # bottom
-                    table_y1 = table.bbox[3]  # top
-
-                    # Add small margin (5 points) to avoid edge cases
-                    if table_y0 - 5 <= elem_y0 <= table_y1 + 5:
-                        return True
-
-                return False
+                # Check if element's y0 falls within a table's vertical range
+                return any(
+                    low <= elem_y0 <= high
+                    for low, high in table_ranges.get(elem.page_number, ())
+                )
 
             # Filter out overlapping text elements
-            filtered_elements = [
-                elem for elem in elements if not overlaps_table(elem, table_elements)
-            ]
+            filtered_elements = [elem for elem in elements if not overlaps_table(elem)]
 
             # Create a combined list with position info
             all_elements: list[
@@ -15,14 +15,17 @@ Example:
     Second paragraph...: 12.0pt
 """
 
+import functools
 import logging
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import pdfplumber
 import pymupdf  # type: ignore[import-untyped]
 
-from unpdf.processors.checkboxes import CheckboxDetector
+from unpdf.processors.checkboxes import CheckboxDetector, CheckboxDrawing
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +147,8 @@ def extract_text_with_metadata(
 
     spans: list[dict[str, Any]] = []
     checkbox_detector = CheckboxDetector()
+    # Checkboxes and page height per page, applied after extraction
+    page_checkbox_map: dict[int, tuple[list[CheckboxDrawing], float]] = {}
 
     # Open PyMuPDF document for checkbox detection
     pymupdf_doc = pymupdf.open(str(pdf_path))
@@ -170,6 +175,8 @@ def extract_text_with_metadata(
                 logger.debug(
                     f"Page {page_num}: Detected {len(page_checkboxes)} checkboxes"
                 )
+                if page_checkboxes:
+                    page_checkbox_map[page_num] = (page_checkboxes, page.height)
 
                 # Extract characters with detailed metadata
                 chars = page.chars
@@ -241,21 +248,19 @@ def extract_text_with_metadata(
                 if current_span and current_span["text"].strip():
                     spans.append(current_span)
 
-                # Annotate spans with checkboxes for this page
-                # Filter spans for this page
-                page_start_idx = len(spans) - sum(
-                    1 for s in spans if s["page_number"] == page_num
-                )
-                page_spans = spans[page_start_idx:]
-
-                if page_checkboxes and page_spans:
-                    # Get page height for coordinate conversion
-                    page_height = page.height
-                    annotated = checkbox_detector.annotate_text_with_checkboxes(
-                        page_spans, page_checkboxes, page_height
-                    )
-                    # Update the spans in place
-                    spans[page_start_idx:] = annotated
+            # Annotate spans with checkboxes in one pass over page groups
+            # (spans are produced in page order)
+            if page_checkbox_map:
+                annotated_spans: list[dict[str, Any]] = []
+                for page_num, group in groupby(spans, key=itemgetter("page_number")):
+                    page_spans = list(group)
+                    if page_num in page_checkbox_map:
+                        page_checkboxes, page_height = page_checkbox_map[page_num]
+                        page_spans = checkbox_detector.annotate_text_with_checkboxes(
+                            page_spans, page_checkboxes, page_height
+                        )
+                    annotated_spans.extend(page_spans)
+                spans = annotated_spans
 
         logger.info(f"Extracted {len(spans)} text span(s)")
         return spans
@@ -267,9 +272,13 @@ def extract_text_with_metadata(
         pymupdf_doc.close()
 
 
+@functools.lru_cache(maxsize=256)
 def _is_bold_font(font_name: str) -> bool:
     """Detect if font is bold based on font name.
 
+    Called once per character during extraction; a PDF uses only a handful
+    of font names, so results are cached per name.
+
     Args:
         font_name: Font name string.
 
@@ -283,9 +292,12 @@ def _is_bold_font(font_name: str) -> bool:
     )
 
 
+@functools.lru_cache(maxsize=256)
 def _is_italic_font(font_name: str) -> bool:
     """Detect if font is italic based on font name.
 
+    Results are cached per font name (see _is_bold_font).
+
     Args:
         font_name: Font name string.
 
@@ -20,7 +20,7 @@ from unpdf.processors.headings import Element, ParagraphElement
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockquoteElement(Element):
     """Blockquote element.
 
@@ -70,7 +70,7 @@ class BlockquoteProcessor:
     """
 
     # Quote mark characters (regular, smart quotes, and guillemets)
-    QUOTE_CHARS = {'"', "'", "»", "«"}
+    QUOTE_CHARS = frozenset({'"', "'", "»", "«"})
 
     def __init__(
         self,
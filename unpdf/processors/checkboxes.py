@@ -4,14 +4,16 @@ This module detects checkboxes rendered as vector graphics in PDFs
 (common in Obsidian exports) and annotates text with checkbox markers.
 """
 
+import functools
 import logging
+import math
 from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckboxDrawing:
     """Represents a checkbox detected from PDF drawings.
 
@@ -59,6 +61,25 @@ class CheckboxDetector:
         (0.597, 0.451, 0.967),  # Purple from Obsidian
     ]
 
+    # Markdown task-list prefixes, indexed by checked state
+    TASK_MARKERS = ("[ ] ", "[x] ")
+
+    # Lowercase substrings identifying monospace (code) fonts
+    MONOSPACE_FONTS = (
+        "courier",
+        "consolas",
+        "monaco",
+        "menlo",
+        "cascadia",
+        "roboto mono",
+        "source code",
+        "fira code",
+        "jetbrains mono",
+        "inconsolata",
+        "dejavu sans mono",
+        "ubuntu mono",
+    )
+
     def __init__(
         self,
         size_range: tuple[float, float] | None = None,
@@ -72,6 +93,11 @@ class CheckboxDetector:
         """
         self.checkbox_size_range = size_range or self.CHECKBOX_SIZE_RANGE
         self.vertical_tolerance = vertical_tolerance or self.VERTICAL_TOLERANCE
+        # Bounded memo of the font-name check, built per instance so an
+        # overridden MONOSPACE_FONTS is respected
+        self._monospace_lookup = functools.lru_cache(maxsize=128)(
+            self._match_monospace_font
+        )
 
     def _is_monospace_font(self, font_name: str) -> bool:
         """Check if font is monospace/code font.
@@ -82,22 +108,19 @@ class CheckboxDetector:
         Returns:
             True if monospace font.
         """
-        monospace_patterns = [
-            "courier",
-            "consolas",
-            "monaco",
-            "menlo",
-            "cascadia",
-            "roboto mono",
-            "source code",
-            "fira code",
-            "jetbrains mono",
-            "inconsolata",
-            "dejavu sans mono",
-            "ubuntu mono",
-        ]
+        return self._monospace_lookup(font_name)
+
+    def _match_monospace_font(self, font_name: str) -> bool:
+        """Match font name against MONOSPACE_FONTS (uncached).
+
+        Args:
+            font_name: Font family name.
+
+        Returns:
+            True if monospace font.
+        """
         font_lower = font_name.lower()
-        return any(pattern in font_lower for pattern in monospace_patterns)
+        return any(pattern in font_lower for pattern in self.MONOSPACE_FONTS)
 
     def detect_checkboxes(self, page: Any) -> list[CheckboxDrawing]:
         """Detect all checkboxes on a PDF page.
@@ -153,35 +176,39 @@ class CheckboxDetector:
                 converts checkbox coords from PyMuPDF (top-left origin).
 
         Returns:
-            Text spans with checkbox markers added to text content.
+            Text spans with checkbox markers added to text content. Only
+            annotated spans are copied; the input spans are never modified.
         """
-        # Create a copy to avoid modifying original
-        annotated_spans = [span.copy() for span in text_spans]
+        # Convert checkbox y-coordinates once if needed
+        # PyMuPDF: origin top-left, y increases downward
+        # pdfplumber: origin bottom-left, y increases upward
+        # Real checkboxes sit at the left margin (< 100pts from left), so
+        # anything further right can never mark a task item and is dropped here
+        checkbox_positions = [
+            (checkbox, page_height - checkbox.y if page_height else checkbox.y)
+            for checkbox in checkboxes
+            if checkbox.x < 100.0
+        ]
+        if not checkbox_positions:
+            return list(text_spans)
+
+        vertical_tolerance = self.vertical_tolerance
+        annotated_spans = []
 
-        for span in annotated_spans:
+        for span in text_spans:
+            annotated = span
             # Get span y-center (in pdfplumber coords if page_height provided)
             span_y_center = (span["y0"] + span["y1"]) / 2
             span_x0 = span["x0"]
 
-            for checkbox in checkboxes:
-                # Convert checkbox y-coordinate if needed
-                # PyMuPDF: origin top-left, y increases downward
-                # pdfplumber: origin bottom-left, y increases upward
-                checkbox_y = checkbox.y
-                if page_height:
-                    checkbox_y = page_height - checkbox.y
-
+            for checkbox, checkbox_y in checkbox_positions:
                 # Check vertical AND horizontal alignment
                 # Checkbox should be:
                 # 1. Vertically aligned with text (same line)
-                # 2. At left margin (not mid-sentence) - real checkboxes are < 100pts from left
-                # 3. Close to text horizontally (within 30pts)
-                horizontal_distance = abs(checkbox.x - span_x0)
-                is_left_margin = checkbox.x < 100.0
+                # 2. Close to text horizontally (within 30pts)
                 if (
-                    abs(checkbox_y - span_y_center) <= self.vertical_tolerance
-                    and horizontal_distance <= 30.0
-                    and is_left_margin
+                    abs(checkbox_y - span_y_center) <= vertical_tolerance
+                    and abs(checkbox.x - span_x0) <= 30.0
                 ):
                     # Skip monospace fonts - they're likely inline code demonstrations
                     # of checkbox syntax, not actual checkboxes
@@ -192,17 +219,23 @@ class CheckboxDetector:
                         )
                         continue
 
-                    # Add checkbox marker to beginning of text
-                    marker = "[x]" if checkbox.is_checked else "[ ]"
-                    span["text"] = f"{marker} {span['text']}"
-                    span["has_checkbox"] = True
-                    span["checkbox_checked"] = checkbox.is_checked
+                    # Add checkbox marker to beginning of text, on a copy so
+                    # the original span is left untouched
+                    marker = self.TASK_MARKERS[checkbox.is_checked]
+                    annotated = {
+                        **span,
+                        "text": marker + span["text"],
+                        "has_checkbox": True,
+                        "checkbox_checked": checkbox.is_checked,
+                    }
                     logger.debug(
-                        f"Added checkbox marker '{marker}' to text at "
-                        f"y={span_y_center:.1f}: {span['text'][:40]}..."
+                        f"Added checkbox marker '{marker.rstrip()}' to text at "
+                        f"y={span_y_center:.1f}: {annotated['text'][:40]}..."
                     )
                     break  # Only one checkbox per line
 
+            annotated_spans.append(annotated)
+
         return annotated_spans
 
     def _group_drawings_by_position(
@@ -220,26 +253,48 @@ class CheckboxDetector:
             List of drawing groups.
         """
         groups: list[list[dict[str, Any]]] = []
+        # Center of each group's first drawing, computed once per group
+        group_centers: list[tuple[float, float]] = []
+        # Grid cell -> indices of the groups whose center lies in that cell.
+        # Cells are twice the tolerance wide, so any center within tolerance
+        # is in the same or an adjacent cell, even with float rounding.
+        cell_size = 2 * tolerance if tolerance > 0 else 1.0
+        grid: dict[tuple[int, int], list[int]] = {}
 
         for drawing in drawings:
             rect = drawing["rect"]
             cx = (rect.x0 + rect.x1) / 2
             cy = (rect.y0 + rect.y1) / 2
 
-            # Find existing group this belongs to
-            found_group = False
-            for group in groups:
-                group_rect = group[0]["rect"]
-                group_cx = (group_rect.x0 + group_rect.x1) / 2
-                group_cy = (group_rect.y0 + group_rect.y1) / 2
+            # A NaN or infinite center is never within tolerance of anything
+            # and has no grid cell, so it always starts its own group
+            if not (math.isfinite(cx) and math.isfinite(cy)):
+                groups.append([drawing])
+                group_centers.append((cx, cy))
+                continue
 
-                if abs(cx - group_cx) <= tolerance and abs(cy - group_cy) <= tolerance:
-                    group.append(drawing)
-                    found_group = True
-                    break
+            col = int(cx // cell_size)
+            row = int(cy // cell_size)
+
+            # Join the earliest group within tolerance, as a linear scan would
+            match = min(
+                (
+                    index
+                    for neighbor_col in (col - 1, col, col + 1)
+                    for neighbor_row in (row - 1, row, row + 1)
+                    for index in grid.get((neighbor_col, neighbor_row), ())
+                    if abs(cx - group_centers[index][0]) <= tolerance
+                    and abs(cy - group_centers[index][1]) <= tolerance
+                ),
+                default=None,
+            )
 
-            if not found_group:
+            if match is not None:
+                groups[match].append(drawing)
+            else:
+                grid.setdefault((col, row), []).append(len(groups))
                 groups.append([drawing])
+                group_centers.append((cx, cy))
 
         return groups
 
@@ -256,24 +311,23 @@ class CheckboxDetector:
         Returns:
             True if group appears to be a checkbox.
         """
-        if not group:
+        # Checkboxes typically have multiple layers
+        # Checked: 2-7 drawings (outline + fill + checkmark)
+        # Unchecked: 1-2 drawings (just outline, sometimes with fill)
+        # Cheapest checks first: most groups are glyph fragments or page
+        # borders that fail the structure or size test
+        if not 1 <= len(group) <= 7:
             return False
 
         # Check size of primary shape
         rect = group[0]["rect"]
-        width = rect.x1 - rect.x0
-        height = rect.y1 - rect.y0
-
-        # Checkbox should be roughly square and within size range
-        is_square = 0.7 <= (width / height) <= 1.3 if height > 0 else False
-        is_right_size = min_size <= width <= max_size and min_size <= height <= max_size
-
-        # Checkboxes typically have multiple layers
-        # Checked: 2-7 drawings (outline + fill + checkmark)
-        # Unchecked: 1-2 drawings (just outline, sometimes with fill)
-        has_valid_structure = 1 <= len(group) <= 7
+        width: float = rect.x1 - rect.x0
+        height: float = rect.y1 - rect.y0
+        if not (min_size <= width <= max_size and min_size <= height <= max_size):
+            return False
 
-        return is_square and is_right_size and has_valid_structure
+        # Checkbox should be roughly square
+        return height > 0 and 0.7 <= (width / height) <= 1.3
 
     def _is_checked(self, group: list[dict[str, Any]]) -> bool:
         """Determine if a checkbox group represents a checked box.
@@ -12,6 +12,7 @@ Example:
     '`print(\'hello\')`'
 """
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -22,7 +23,7 @@ from unpdf.processors.headings import Element, ParagraphElement
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlockElement(Element):
     """Code block element (fenced with triple backticks).
 
@@ -50,7 +51,7 @@ class CodeBlockElement(Element):
         return f"{fence}\n{self.text}\n{fence}"
 
 
-@dataclass
+@dataclass(slots=True)
 class InlineCodeElement(Element):
     """Inline code element (single backticks).
 
@@ -70,8 +71,10 @@ class InlineCodeElement(Element):
             "`print(x)`"
         """
         # Escape backticks in code if present
-        escaped_text = self.text.replace("`", "\\`")
-        return f"`{escaped_text}`"
+        text = self.text
+        if "`" in text:
+            text = text.replace("`", "\\`")
+        return f"`{text}`"
 
 
 class CodeProcessor:
@@ -81,7 +84,7 @@ class CodeProcessor:
     multi-line monospace text, while inline code is shorter.
 
     Attributes:
-        monospace_patterns: Font name patterns indicating monospace fonts.
+        monospace_regex: Compiled alternation of MONOSPACE_PATTERNS.
         block_threshold: Minimum characters for code block vs inline.
 
     Example:
@@ -121,9 +124,16 @@ class CodeProcessor:
             50
         """
         self.block_threshold = block_threshold
-        self.monospace_patterns = [
-            re.compile(pattern, re.IGNORECASE) for pattern in self.MONOSPACE_PATTERNS
-        ]
+        # One alternation scans the font name once instead of once per pattern.
+        # Built from MONOSPACE_PATTERNS here so subclasses can extend the list;
+        # re caches the compiled pattern across instances.
+        self.monospace_regex = re.compile(
+            "|".join(self.MONOSPACE_PATTERNS), re.IGNORECASE
+        )
+        # process() checks the font of every span; memoize by font name
+        self._monospace_lookup = functools.lru_cache(maxsize=128)(
+            self._match_monospace_font
+        )
 
     def process(
         self, span: dict[str, Any]
@@ -188,8 +198,18 @@ class CodeProcessor:
         if not font_name:
             return False
 
-        # Check against all patterns
-        return any(pattern.search(font_name) for pattern in self.monospace_patterns)
+        return self._monospace_lookup(font_name)
+
+    def _match_monospace_font(self, font_name: str) -> bool:
+        """Match font name against the monospace alternation (uncached).
+
+        Args:
+            font_name: Font family name from PDF.
+
+        Returns:
+            True if font appears to be monospace.
+        """
+        return self.monospace_regex.search(font_name) is not None
 
     def _infer_language(self, text: str) -> str:
         r"""Attempt to infer programming language from code content.
@@ -250,16 +270,17 @@ class CodeProcessor:
             return "javascript"
 
         # JSON indicators (check before bash to avoid confusion with quotes)
+        stripped = text.strip()
         if (
-            text.strip().startswith("{")
-            and text.strip().endswith("}")
+            stripped.startswith("{")
+            and stripped.endswith("}")
             and '"' in text
             and ":" in text
         ):
             return "json"
         if (
-            text.strip().startswith("[")
-            and text.strip().endswith("]")
+            stripped.startswith("[")
+            and stripped.endswith("]")
             and ('"' in text or "{" in text)
         ):
             return "json"
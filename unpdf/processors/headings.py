@@ -14,13 +14,14 @@ Example:
 """
 
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Element:
     """Base class for document elements."""
 
@@ -37,7 +38,7 @@ class Element:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingElement(Element):
     """Heading element with level (H1-H6).
 
@@ -63,7 +64,7 @@ class HeadingElement(Element):
         return f"{prefix} {self.text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphElement(Element):
     """Plain paragraph element.
 
@@ -85,7 +86,7 @@ class ParagraphElement(Element):
         return self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkElement(Element):
     """Hyperlink element.
 
@@ -133,6 +134,12 @@ class HeadingProcessor:
         1
     """
 
+    # Minimum bold font size (pt) for H5, H4, H3, H2, H1; smaller is H6
+    BOLD_LEVEL_SIZES = (13.2, 14.8, 16.5, 18.5, 21.0)
+
+    # Minimum size/threshold ratio for H4, H3, H2, H1; smaller is H5
+    RATIO_LEVEL_BOUNDS = (1.2, 1.4, 1.7, 2.0)
+
     def __init__(
         self,
         avg_font_size: float,
@@ -168,6 +175,8 @@ class HeadingProcessor:
         self.heading_ratio = heading_ratio
         self.max_level = max_level
         self.threshold = avg_font_size * heading_ratio
+        # Bold text at or above 90% of average size also counts as a heading
+        self.bold_threshold = avg_font_size * 0.90
 
         logger.debug(
             f"HeadingProcessor initialized: avg={avg_font_size:.1f}pt, "
@@ -204,11 +213,7 @@ class HeadingProcessor:
 
         # Bold text at or above average size is likely a heading
         # OR text significantly larger than average (threshold)
-        if (
-            is_bold
-            and font_size >= (self.avg_font_size * 0.90)
-            or font_size >= self.threshold
-        ):
+        if is_bold and font_size >= self.bold_threshold or font_size >= self.threshold:
             level = self._calculate_level(font_size, is_bold)
             logger.debug(
                 f"Detected heading: '{text[:30]}...' "
@@ -243,33 +248,14 @@ class HeadingProcessor:
             - 13-14pt and bold -> H5
             - threshold+ -> H6 or adjust based on ratio
         """
-        # For bold text, use absolute size ranges
+        # Each bound reached moves the heading up one level
         if is_bold:
-            if font_size >= 21.0:
-                level = 1
-            elif font_size >= 18.5:
-                level = 2
-            elif font_size >= 16.5:
-                level = 3
-            elif font_size >= 14.8:
-                level = 4
-            elif font_size >= 13.2:
-                level = 5
-            else:
-                level = 6
+            # For bold text, use absolute size ranges
+            level = 6 - bisect_right(self.BOLD_LEVEL_SIZES, font_size)
         else:
             # Non-bold large text, use ratio-based approach
             size_ratio = font_size / self.threshold
-            if size_ratio >= 2.0:
-                level = 1
-            elif size_ratio >= 1.7:
-                level = 2
-            elif size_ratio >= 1.4:
-                level = 3
-            elif size_ratio >= 1.2:
-                level = 4
-            else:
-                level = 5
+            level = 5 - bisect_right(self.RATIO_LEVEL_BOUNDS, size_ratio)
 
         # Ensure within max_level
         level = min(level, self.max_level)
@@ -17,7 +17,7 @@ from unpdf.processors.headings import Element
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalRuleElement(Element):
     """Horizontal rule element (---).
 
@@ -4,6 +4,12 @@ import re
 
 import pdfplumber
 
+# Regex pattern for plain-text URLs
+URL_PATTERN = re.compile(
+    r"http[s]?://"
+    r"(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+
 
 class LinkInfo:
     """Information about a hyperlink."""
@@ -103,13 +109,7 @@ def _extract_plain_urls(text: str) -> list[str]:
     Returns:
         List of URLs found in the text
     """
-    # Regex pattern for URLs
-    url_pattern = re.compile(
-        r"http[s]?://"
-        r"(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-    )
-
-    urls = url_pattern.findall(text)
+    urls = URL_PATTERN.findall(text)
     return list(set(urls))  # Remove duplicates
 
 
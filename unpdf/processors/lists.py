@@ -12,6 +12,7 @@ Example:
     '- First item'
 """
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -22,7 +23,7 @@ from unpdf.processors.headings import Element, ParagraphElement
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListItemElement(Element):
     """List item element (bullet or numbered).
 
@@ -64,6 +65,10 @@ class ListProcessor:
     Attributes:
         bullet_chars: Set of characters that indicate bullet points.
         number_pattern: Regex pattern for numbered list items.
+        checkbox_pattern: Regex pattern for checkbox list items.
+        cid_pattern: Regex pattern for CID bullet placeholders.
+        marker_pattern: Combined regex built from the checkbox, CID and
+            number patterns; rebuilt whenever one of them is assigned.
         list_indent_x0s: Known x0 coordinates that indicate list items.
         in_list_context: Whether we're currently in a list section.
 
@@ -76,7 +81,7 @@ class ListProcessor:
     """
 
     # Common bullet characters in PDFs
-    BULLET_CHARS = {"•", "●", "○", "◦", "▪", "▫", "–", "-", "·", "►", "➢"}
+    BULLET_CHARS = frozenset({"•", "●", "○", "◦", "▪", "▫", "–", "-", "·", "►", "➢"})
 
     # Pattern for numbered lists: "1.", "a)", "i.", etc.
     NUMBER_PATTERN = re.compile(r"^(\d+\.|[a-z]\)|[ivxlcdm]+\.)\s+", re.IGNORECASE)
@@ -113,13 +118,56 @@ class ListProcessor:
         self.base_indent = base_indent
         self.indent_threshold = indent_threshold
         self.bullet_chars = self.BULLET_CHARS
-        self.number_pattern = self.NUMBER_PATTERN
-        self.checkbox_pattern = self.CHECKBOX_PATTERN
-        self.cid_pattern = self.CID_PATTERN
+        self._number_pattern = self.NUMBER_PATTERN
+        self._checkbox_pattern = self.CHECKBOX_PATTERN
+        self._cid_pattern = self.CID_PATTERN
+        self._update_marker_pattern()
         self.list_indent_x0s = self.LIST_INDENT_X0S
         self.in_list_context = False
         self.last_header = ""
 
+    @property
+    def number_pattern(self) -> re.Pattern[str]:
+        """Regex pattern for numbered list items."""
+        return self._number_pattern
+
+    @number_pattern.setter
+    def number_pattern(self, pattern: re.Pattern[str]) -> None:
+        self._number_pattern = pattern
+        self._update_marker_pattern()
+
+    @property
+    def checkbox_pattern(self) -> re.Pattern[str]:
+        """Regex pattern for checkbox list items."""
+        return self._checkbox_pattern
+
+    @checkbox_pattern.setter
+    def checkbox_pattern(self, pattern: re.Pattern[str]) -> None:
+        self._checkbox_pattern = pattern
+        self._update_marker_pattern()
+
+    @property
+    def cid_pattern(self) -> re.Pattern[str]:
+        """Regex pattern for CID bullet placeholders."""
+        return self._cid_pattern
+
+    @cid_pattern.setter
+    def cid_pattern(self, pattern: re.Pattern[str]) -> None:
+        self._cid_pattern = pattern
+        self._update_marker_pattern()
+
+    def _update_marker_pattern(self) -> None:
+        """Rebuild marker_pattern from the current marker patterns.
+
+        Runs whenever one of them is assigned, so process() reads a plain
+        attribute and overrides still take effect.
+        """
+        self.marker_pattern = _combine_marker_patterns(
+            checkbox=self._checkbox_pattern,
+            cid=self._cid_pattern,
+            number=self._number_pattern,
+        )
+
     def process(self, span: dict[str, Any]) -> ListItemElement | ParagraphElement:
         """Process text span and detect list items.
 
@@ -140,6 +188,8 @@ class ListProcessor:
             >>> result.text
             'First item'
         """
+        # Strip once: marker patterns consume their trailing whitespace, so
+        # the text left after a marker needs no further stripping
         text = span["text"].strip()
         x0 = span.get("x0", 0)
         y0 = span.get("y0", 0.0)
@@ -148,13 +198,31 @@ class ListProcessor:
         # Calculate indent level based on x-coordinate
         indent_level = self._calculate_indent_level(x0)
 
-        # Check for checkbox list items first (e.g., "[ ] Task" or "[x] Done")
-        # Only treat as checkbox if the span was annotated by the CheckboxDetector
-        # (to avoid false positives on literal "[ ]" text in demonstrations)
-        checkbox_match = self.checkbox_pattern.match(text)
-        has_checkbox = span.get("has_checkbox", False)
-        if checkbox_match and has_checkbox:
-            cleaned_text = text[checkbox_match.end() :].strip()
+        # Identify the explicit list marker (if any). Bullets are single
+        # characters, so a set lookup settles them without entering the regex.
+        marker = None
+        marker_kind: str | None = None
+        if self._is_bullet_list(text):
+            marker_kind = "bullet"
+        else:
+            marker = self.marker_pattern.match(text)
+            if (
+                marker
+                and marker.lastgroup == "checkbox"
+                and not span.get("has_checkbox", False)
+            ):
+                # Literal "[ ]" text is not a task item; try the other markers
+                # as checking each pattern in turn would
+                marker = _combine_marker_patterns(
+                    cid=self.cid_pattern, number=self.number_pattern
+                ).match(text)
+            marker_kind = marker.lastgroup if marker else None
+
+        # Checkbox list items (e.g., "[ ] Task" or "[x] Done")
+        # Only spans annotated by the CheckboxDetector get here; literal "[ ]"
+        # text in demonstrations was sent to the other markers above
+        if marker and marker_kind == "checkbox":
+            cleaned_text = text[marker.end() :]
             # Use the checkbox state from the detector, not the text marker
             checked = span.get("checkbox_checked", False)
             list_text = f"[{'x' if checked else ' '}] {cleaned_text}"
@@ -167,10 +235,9 @@ class ListProcessor:
                 page_number=page_number,
             )
 
-        # Check for CID bullet markers (e.g., "(cid:127)" )
-        cid_match = self.cid_pattern.match(text)
-        if cid_match:
-            cleaned_text = text[cid_match.end() :].strip()
+        # CID bullet markers (e.g., "(cid:127)" )
+        if marker and marker_kind == "cid":
+            cleaned_text = text[marker.end() :]
             logger.debug(f"Detected CID bullet item: '{cleaned_text[:30]}...'")
             return ListItemElement(
                 text=cleaned_text,
@@ -180,8 +247,8 @@ class ListProcessor:
                 page_number=page_number,
             )
 
-        # Check for bullet list (explicit markers)
-        if self._is_bullet_list(text):
+        # Bullet list (explicit markers)
+        if marker_kind == "bullet":
             cleaned_text = self._remove_bullet(text)
             logger.debug(f"Detected bullet item: '{cleaned_text[:30]}...'")
             return ListItemElement(
@@ -192,11 +259,10 @@ class ListProcessor:
                 page_number=page_number,
             )
 
-        # Check for numbered list
-        numbered_match = self.number_pattern.match(text)
-        if numbered_match:
+        # Numbered list
+        if marker and marker_kind == "number":
             # Remove the number prefix
-            cleaned_text = text[numbered_match.end() :].strip()
+            cleaned_text = text[marker.end() :]
             logger.debug(f"Detected numbered item: '{cleaned_text[:30]}...'")
             return ListItemElement(
                 text=cleaned_text,
@@ -342,3 +408,36 @@ class ListProcessor:
         lower_text = header_text.lower()
         self.in_list_context = ("list" in lower_text) or ("checklist" in lower_text)
         self.last_header = header_text
+
+
+# Regex flags that can be scoped to one alternative with an inline group
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _combine_marker_patterns(**patterns: re.Pattern[str]) -> re.Pattern[str]:
+    """Join list marker patterns into one alternation of named groups.
+
+    Alternatives are tried in keyword order, so the first pattern that
+    matches wins, exactly as when matching the patterns one after another.
+    Each pattern keeps its own flags through a scoped inline-flag group.
+
+    Args:
+        **patterns: Compiled patterns keyed by the group name to report.
+
+    Returns:
+        Compiled alternation.
+    """
+    alternatives = []
+    for name, pattern in patterns.items():
+        flags = "".join(
+            letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag
+        )
+        body = f"(?{flags}:{pattern.pattern})" if flags else pattern.pattern
+        alternatives.append(f"(?P<{name}>{body})")
+    return re.compile("|".join(alternatives))
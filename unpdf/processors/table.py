@@ -19,7 +19,7 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableElement:
     r"""Represents a table element with rows and columns.
 
@@ -142,6 +142,15 @@ class TableProcessor:
         ...     print(table.to_markdown())
     """
 
+    # Fallback settings for text-aligned (borderless) tables
+    RELAXED_TABLE_SETTINGS: dict[str, Any] = {
+        "vertical_strategy": "text",
+        "horizontal_strategy": "text",
+        "intersection_tolerance": 5,
+        "min_words_vertical": 2,
+        "snap_tolerance": 3,
+    }
+
     def __init__(
         self,
         table_settings: dict[str, Any] | None = None,
@@ -203,14 +212,7 @@ class TableProcessor:
 
             if not tables:
                 # Fallback: try text-based detection (for borderless tables)
-                relaxed_settings = {
-                    "vertical_strategy": "text",
-                    "horizontal_strategy": "text",
-                    "intersection_tolerance": 5,
-                    "min_words_vertical": 2,
-                    "snap_tolerance": 3,
-                }
-                tables = page.find_tables(table_settings=relaxed_settings)
+                tables = page.find_tables(table_settings=self.RELAXED_TABLE_SETTINGS)
                 logger.debug("Using relaxed (text-based) table detection")
 
             page_width = page.width